@@ -203,6 +203,7 @@ class PipelineConfigLoader:
             early_stopping_patience=early_stopping.get("patience", 10),
             early_stopping_min_delta=early_stopping.get("min_delta", 1e-4),
             plot_training=training_dict.get("plot_training", True),
+            mixed_precision=training_dict.get("mixed_precision", True),
         )
 
     def _create_evaluation_config(
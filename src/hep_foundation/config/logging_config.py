@@ -1,4 +1,5 @@
 import logging
+import warnings
 
 # Add custom PROGRESS log level (between INFO=20 and WARNING=30)
 PROGRESS_LEVEL = 25
@@ -9,22 +10,49 @@ TEMPLOG_LEVEL = 35
 logging.addLevelName(TEMPLOG_LEVEL, "TEMPLOG")
 
 
-def progress(self, message, *args, **kwargs):
-    """Log a progress message at PROGRESS level."""
-    if self.isEnabledFor(PROGRESS_LEVEL):
-        self._log(PROGRESS_LEVEL, message, args, **kwargs)
+def _make_level_logger(level, level_name):
+    """Create a Logger method that logs at a fixed level.
 
+    The level is captured in a closure cell instead of being looked up as a
+    module global on every call.
+    """
+
+    def log_at_level(self, message, *args, **kwargs):
+        """Log a message at this method's custom level (e.g. PROGRESS)."""
+        if self.isEnabledFor(level):
+            self._log(level, message, args, **kwargs)
+
+    log_at_level.__name__ = level_name.lower()
+    return log_at_level
 
-def templog(self, message, *args, **kwargs):
-    """Log a templog message at TEMPLOG level."""
-    if self.isEnabledFor(TEMPLOG_LEVEL):
-        self._log(TEMPLOG_LEVEL, message, args, **kwargs)
+
+progress = _make_level_logger(PROGRESS_LEVEL, "PROGRESS")
+templog = _make_level_logger(TEMPLOG_LEVEL, "TEMPLOG")
 
 
 # Add the progress method to Logger class
 logging.Logger.progress = progress
 logging.Logger.templog = templog
 
+# Whether third-party library logging has already been configured
+_library_logging_configured = False
+
+
+def _configure_library_logging():
+    """Quiet TensorFlow Python warnings and logging (only done once per process)"""
+    global _library_logging_configured
+    if _library_logging_configured:
+        return
+
+    # Suppress specific TensorFlow Python warnings
+    warnings.filterwarnings("ignore", category=UserWarning, module="tensorflow")
+
+    # Set TensorFlow logging level. tf.get_logger() is the standard "tensorflow"
+    # logger, so it is configured by name to avoid importing TensorFlow here.
+    logging.getLogger("tensorflow").setLevel(logging.ERROR)  # Only show ERROR messages
+
+    _library_logging_configured = True
+
 
 def setup_logging(level=logging.INFO, log_file=None):
     """Setup logging configuration for the entire package
@@ -34,19 +62,8 @@ def setup_logging(level=logging.INFO, log_file=None):
     any TensorFlow imports can occur.
     """
 
-    # Suppress specific TensorFlow Python warnings
-    import warnings
-
-    warnings.filterwarnings("ignore", category=UserWarning, module="tensorflow")
-
-    # Set TensorFlow logging level
-    try:
-        import tensorflow as tf
-
-        tf.get_logger().setLevel(logging.ERROR)  # Only show ERROR messages
-    except ImportError:
-        # TensorFlow not available, skip TF logging configuration
-        pass
+    # Repeated calls only reconfigure the handlers below
+    _configure_library_logging()
 
     # Create formatter
     if level == logging.DEBUG:
@@ -1,4 +1,7 @@
+import functools
 import json
+import logging
+import math
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -13,10 +16,42 @@ from hep_foundation.data.physlite_utilities import (
     PhysliteSelectionConfig,
 )
 
+# orjson is an optional speedup; fall back to the stdlib codec when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get module-specific logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _try_branch(branch_name: str) -> Optional[PhysliteBranch]:
+    """
+    Get a (shared) PhysliteBranch for a branch name, or None if it is invalid.
+
+    PhysliteBranch is treated as immutable, so the same branch referenced from
+    several filters, selectors and aggregators only needs to be validated once;
+    invalid names are cached as None (PhysliteBranch interns the stored name). Use
+    _try_branch.cache_clear() to reset the cache (e.g. in tests).
+    """
+    return PhysliteBranch.try_create(branch_name)
+
+
+def _branch(branch_name: str) -> PhysliteBranch:
+    """
+    Get a (shared) PhysliteBranch for a branch name.
+
+    Raises:
+        ValueError: If the branch name is invalid
+    """
+    branch = _try_branch(branch_name)
+    if branch is None:
+        raise ValueError(f"Invalid branch name: {branch_name}")
+    return branch
+
+
 class TaskConfig:
     """
     High-level configuration for a specific HEP analysis task.
@@ -26,12 +61,18 @@ class TaskConfig:
     - Input data selection configuration
     - Optional label configurations for supervised learning tasks
 
+    The serialized forms returned by to_dict/to_json are cached. Code that
+    modifies the attributes after construction (including the nested filters
+    and selection configs) must call _invalidate().
+
     Attributes:
         event_filters: List of event-level feature filters
         input: PhysliteSelectionConfig for input data
         labels: List of PhysliteSelectionConfig for target labels
     """
 
+    __slots__ = ("event_filters", "input", "labels", "_dict_cache", "_json_cache")
+
     def __init__(
         self,
         event_filters: list[PhysliteFeatureFilter],
@@ -51,6 +92,15 @@ class TaskConfig:
         self.input = input_config
         self.labels = label_configs or []
 
+        # Serialization caches (see _invalidate)
+        self._dict_cache: Optional[dict[str, Any]] = None
+        self._json_cache: dict[int, str] = {}
+
+    def _invalidate(self) -> None:
+        """Clear cached serializations after the configuration was modified."""
+        self._dict_cache = None
+        self._json_cache = {}
+
     def __str__(self) -> str:
         return (
             f"TaskConfig(event_filters={len(self.event_filters)}, "
@@ -71,77 +121,65 @@ class TaskConfig:
         Returns:
             JSON string representation of the task configuration
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        json_str = self._json_cache.get(indent)
+        if json_str is None:
+            # orjson only supports two-space indentation
+            if orjson is not None and indent == 2:
+                json_str = self.to_json_bytes().decode()
+            else:
+                json_str = json.dumps(self.to_dict(), indent=indent)
+            self._json_cache[indent] = json_str
+        return json_str
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_json_bytes(self) -> bytes:
         """
-        Convert task configuration to a dictionary.
+        Convert task configuration to UTF-8 encoded JSON with two-space indentation.
+
+        Uses orjson on the (cached) to_dict form when it is available.
 
         Returns:
-            Dictionary representation of the task configuration
+            JSON bytes representation of the task configuration
         """
-        return {
-            "event_filters": [
-                {
-                    "branch_name": f.branch.name,
-                    "min_value": f.min_value,
-                    "max_value": f.max_value,
-                }
-                for f in self.event_filters
-            ],
-            "input": self._selection_config_to_dict(self.input),
-            "labels": [self._selection_config_to_dict(label) for label in self.labels],
-        }
-
-    def _selection_config_to_dict(
-        self, config: PhysliteSelectionConfig
-    ) -> dict[str, Any]:
-        """Helper method to convert a PhysliteSelectionConfig to a dictionary."""
-        # Convert feature selectors
-        feature_selectors = [
-            {"branch_name": s.branch.name} for s in config.feature_selectors
-        ]
-
-        # Convert feature array aggregators
-        feature_array_aggregators = []
-        for agg in config.feature_array_aggregators:
-            # Convert input branches
-            input_branches = [
-                {"branch_name": b.branch.name} for b in agg.input_branches
-            ]
-
-            # Convert filter branches
-            filter_branches = [
-                {
-                    "branch_name": f.branch.name,
-                    "min_value": f.min_value,
-                    "max_value": f.max_value,
-                }
-                for f in agg.filter_branches
-            ]
-
-            # Convert sort_by_branch
-            sort_by_branch = (
-                {"branch_name": agg.sort_by_branch.branch.name}
-                if agg.sort_by_branch
-                else None
+        # orjson writes non-finite floats as null, which would drop infinite
+        # filter bounds; the stdlib writes them as Infinity/NaN instead
+        if orjson is not None and self._filter_bounds_are_finite():
+            # OPT_SERIALIZE_NUMPY handles numpy scalars (e.g. filter bounds),
+            # which the stdlib encoder accepts as float/int subclasses
+            return orjson.dumps(
+                self.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
             )
+        return json.dumps(self.to_dict(), indent=2).encode()
+
+    def _filter_bounds_are_finite(self) -> bool:
+        """Check that no event or aggregator filter has an infinite or NaN bound."""
+        filters = list(self.event_filters)
+        for selection_config in (self.input, *self.labels):
+            for aggregator in selection_config.feature_array_aggregators:
+                filters.extend(aggregator.filter_branches)
+        return all(
+            value is None or math.isfinite(value)
+            for f in filters
+            for value in (f.min_value, f.max_value)
+        )
 
-            feature_array_aggregators.append(
-                {
-                    "input_branches": input_branches,
-                    "filter_branches": filter_branches,
-                    "sort_by_branch": sort_by_branch,
-                    "min_length": agg.min_length,
-                    "max_length": agg.max_length,
-                }
-            )
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert task configuration to a dictionary.
 
-        return {
-            "name": config.name,
-            "feature_selectors": feature_selectors,
-            "feature_array_aggregators": feature_array_aggregators,
+        Returns:
+            Dictionary representation of the task configuration. The dictionary
+            is cached and shared between calls, so it must not be modified.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        self._dict_cache = {
+            "event_filters": [f.to_dict() for f in self.event_filters],
+            "input": self.input.to_dict(),
+            "labels": [label.to_dict() for label in self.labels],
         }
+        return self._dict_cache
 
     def save(self, file_path: Union[str, Path]) -> None:
         """
@@ -153,8 +191,9 @@ class TaskConfig:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w") as f:
-            f.write(self.to_json())
+        # Write the encoded bytes directly, skipping text-mode encoding
+        with open(file_path, "wb") as f:
+            f.write(self.to_json_bytes())
 
     @classmethod
     def load(cls, file_path: Union[str, Path]) -> "TaskConfig":
@@ -175,13 +214,24 @@ class TaskConfig:
         if not file_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
-        with open(file_path) as f:
-            config_dict = json.loads(f.read())
+        with open(file_path, "rb") as f:
+            data = f.read()
+
+        config_dict = None
+        if orjson is not None:
+            try:
+                config_dict = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson rejects the Infinity/NaN tokens the stdlib writes for
+                # non-finite filter bounds, so let the stdlib parse those files
+                pass
+        if config_dict is None:
+            config_dict = json.loads(data)
 
         # Create event filters
         event_filters = []
         for filter_dict in config_dict.get("event_filters", []):
-            branch = PhysliteBranch(filter_dict["branch_name"])
+            branch = _branch(filter_dict["branch_name"])
             if branch.is_feature:
                 event_filters.append(
                     PhysliteFeatureFilter(
@@ -211,151 +261,223 @@ class TaskConfig:
     ) -> PhysliteSelectionConfig:
         """Helper method to convert a dictionary to a PhysliteSelectionConfig."""
 
-        # Create feature selectors
+        feature_names = [
+            selector_dict["branch_name"]
+            for selector_dict in config_dict.get("feature_selectors", [])
+        ]
+        return TaskConfig._build_selection_config(
+            name=config_dict.get("name", "Selection"),
+            feature_selectors=TaskConfig._parse_feature_selectors(
+                feature_names, skip_invalid=False
+            ),
+            aggregator_list=config_dict.get("feature_array_aggregators", []),
+            fallback_names=feature_names,
+        )
+
+    @staticmethod
+    def _parse_feature_selectors(
+        branch_names: list[str], skip_invalid: bool = True
+    ) -> list[PhysliteFeatureSelector]:
+        """
+        Helper method to create scalar feature selectors from branch names.
+
+        Branches that are not scalar features are skipped.
+
+        Args:
+            branch_names: List of branch names to select
+            skip_invalid: If True, invalid branch names are skipped instead of raising
+
+        Returns:
+            List of PhysliteFeatureSelector objects
+
+        Raises:
+            ValueError: If a branch name is invalid and skip_invalid is False
+        """
         feature_selectors = []
-        for selector_dict in config_dict.get("feature_selectors", []):
-            branch = PhysliteBranch(selector_dict["branch_name"])
+        for branch_name in branch_names:
+            if skip_invalid:
+                branch = _try_branch(branch_name)
+                if branch is None:
+                    continue
+            else:
+                branch = _branch(branch_name)
             if branch.is_feature:
                 feature_selectors.append(PhysliteFeatureSelector(branch=branch))
+        return feature_selectors
 
-        # Create feature array aggregators
-        feature_array_aggregators = []
-        for i, agg_dict in enumerate(config_dict.get("feature_array_aggregators", [])):
-            # Create input branch selectors
-            input_branches = []
-            for branch_name in agg_dict.get("input_branches", []):
-                # Directly create and validate branch
-                branch = PhysliteBranch(
-                    branch_name
-                )  # Raises ValueError if name invalid
-                if not branch.is_feature_array:
-                    # Raise error if not a feature array
-                    raise ValueError(
-                        f"Branch '{branch_name}' provided in 'input_branches' for aggregator #{i} "
-                        f"is not a feature array (type: {branch.branch_type.value}). Aggregators require feature arrays."
-                    )
-                selector = PhysliteFeatureArraySelector(
-                    branch=branch
-                )  # This constructor also validates type
-                input_branches.append(selector)
+    @staticmethod
+    def _resolve_aggregator_branches(
+        aggregator_list: list[dict[str, Any]],
+    ) -> dict[str, PhysliteBranch]:
+        """
+        Helper method to validate every branch referenced by a list of aggregator dicts.
 
-            logger.debug(
-                f"Processed input_branches for dict #{i}: {[str(b) for b in input_branches]}"
-            )
+        Each distinct branch name (input, filter or sort) is resolved once.
 
-            # Create filter branch filters
-            filter_branches = []
-            for filter_dict in agg_dict.get("filter_branches", []):
-                branch_name = filter_dict.get("branch")
-                if not branch_name:
-                    raise ValueError(
-                        f"Missing 'branch' key in filter_dict for aggregator #{i}: {filter_dict}"
-                    )
+        Args:
+            aggregator_list: List of aggregator definition dictionaries
 
-                # Directly create and validate branch
-                branch = PhysliteBranch(
-                    branch_name
-                )  # Raises ValueError if name invalid
-                if not branch.is_feature_array:
-                    # Raise error if not a feature array
-                    raise ValueError(
-                        f"Branch '{branch_name}' provided in 'filter_branches' for aggregator #{i} "
-                        f"is not a feature array (type: {branch.branch_type.value}). Aggregator filters require feature arrays."
-                    )
-                filter_obj = PhysliteFeatureArrayFilter(
-                    branch=branch,
-                    min_value=filter_dict.get("min"),
-                    max_value=filter_dict.get("max"),
-                )  # This constructor also validates type
-                filter_branches.append(filter_obj)
+        Returns:
+            Dictionary mapping branch names to PhysliteBranch objects
 
-            logger.debug(
-                f"Processed filter_branches for dict #{i}: {[str(f) for f in filter_branches]}"
+        Raises:
+            ValueError: Listing all invalid branch names, if there are any
+        """
+        branch_names = set()
+        for agg_dict in aggregator_list:
+            branch_names.update(agg_dict.get("input_branches", ()))
+            branch_names.update(
+                filter_dict.get("branch")
+                for filter_dict in agg_dict.get("filter_branches", ())
             )
-
-            # Create sort by branch selector
             sort_branch_dict = agg_dict.get("sort_by_branch")
-            sort_by_branch = None
             if sort_branch_dict:
-                branch_name = sort_branch_dict.get("branch")
-                if not branch_name:
-                    raise ValueError(
-                        f"Missing 'branch' key in sort_by_branch for aggregator #{i}: {sort_branch_dict}"
-                    )
+                branch_names.add(sort_branch_dict.get("branch"))
 
-                # Directly create and validate branch
-                branch = PhysliteBranch(
-                    branch_name
-                )  # Raises ValueError if name invalid
-                if not branch.is_feature_array:
-                    # Raise error if not a feature array
-                    raise ValueError(
-                        f"Branch '{branch_name}' provided in 'sort_by_branch' for aggregator #{i} "
-                        f"is not a feature array (type: {branch.branch_type.value}). Aggregator sorting requires a feature array."
-                    )
-                sort_by_branch = PhysliteFeatureArraySelector(
-                    branch=branch
-                )  # This constructor also validates type
+        # Missing or empty branch names are reported by _parse_aggregator_dict
+        branches = {name: _try_branch(name) for name in branch_names if name}
+
+        invalid_names = sorted(
+            name for name, branch in branches.items() if branch is None
+        )
+        if invalid_names:
+            raise ValueError(
+                f"Invalid branch names in feature array aggregators: {', '.join(invalid_names)}"
+            )
+
+        return branches
+
+    @staticmethod
+    def _parse_aggregator_dict(
+        agg_dict: dict[str, Any], index: int, branches: dict[str, PhysliteBranch]
+    ) -> Optional[PhysliteFeatureArrayAggregator]:
+        """
+        Helper method to create a PhysliteFeatureArrayAggregator from a dictionary.
+
+        Args:
+            agg_dict: Aggregator definition with input_branches, filter_branches,
+                sort_by_branch, min_length and max_length keys
+            index: Position of the aggregator in its list (used in messages)
+            branches: Validated branches by name, from _resolve_aggregator_branches
+
+        Returns:
+            The aggregator, or None if it has no input branches
+
+        Raises:
+            ValueError: If a branch is missing or not a feature array
+        """
+        # Debug messages are only formatted when debug logging is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Processing aggregator dict #{index}: {agg_dict}")
+
+        input_names = agg_dict.get("input_branches", ())
+        filter_dicts = agg_dict.get("filter_branches", ())
+        sort_branch_dict = agg_dict.get("sort_by_branch")
+        min_length = agg_dict.get("min_length", 1)
+        max_length = agg_dict.get("max_length", 100)
+
+        # Create input branch selectors
+        input_branches = []
+        for branch_name in input_names:
+            if not branch_name:
+                raise ValueError(
+                    f"Empty branch name in 'input_branches' for aggregator #{index}: {input_names}"
+                )
 
+            branch = branches[branch_name]
+            if not branch.is_feature_array:
+                # Raise error if not a feature array
+                raise ValueError(
+                    f"Branch '{branch_name}' provided in 'input_branches' for aggregator #{index} "
+                    f"is not a feature array (type: {branch.branch_type.value}). Aggregators require feature arrays."
+                )
+            selector = PhysliteFeatureArraySelector(
+                branch=branch
+            )  # This constructor also validates type
+            input_branches.append(selector)
+
+        if debug:
             logger.debug(
-                f"Processed sort_by_branch for dict #{i}: {str(sort_by_branch)}"
+                f"Processed input_branches for dict #{index}: {[str(b) for b in input_branches]}"
             )
 
-            # Create aggregator if we have input branches
-            # The check for empty input_branches is still relevant - an aggregator needs inputs.
+        # Create filter branch filters
+        filter_branches = []
+        for filter_dict in filter_dicts:
+            branch_name = filter_dict.get("branch")
+            if not branch_name:
+                raise ValueError(
+                    f"Missing 'branch' key in filter_dict for aggregator #{index}: {filter_dict}"
+                )
+
+            branch = branches[branch_name]
+            if not branch.is_feature_array:
+                # Raise error if not a feature array
+                raise ValueError(
+                    f"Branch '{branch_name}' provided in 'filter_branches' for aggregator #{index} "
+                    f"is not a feature array (type: {branch.branch_type.value}). Aggregator filters require feature arrays."
+                )
+            filter_obj = PhysliteFeatureArrayFilter(
+                branch=branch,
+                min_value=filter_dict.get("min"),
+                max_value=filter_dict.get("max"),
+            )  # This constructor also validates type
+            filter_branches.append(filter_obj)
+
+        if debug:
             logger.debug(
-                f"Checking condition for dict #{i}: len(input_branches) = {len(input_branches)}"
+                f"Processed filter_branches for dict #{index}: {[str(f) for f in filter_branches]}"
             )
-            if input_branches:
-                # No need for try-except here anymore, PhysliteFeatureArrayAggregator constructor handles validation
-                logger.debug(f"Attempting to create aggregator for dict #{i}...")
-                aggregator = PhysliteFeatureArrayAggregator(
-                    input_branches=input_branches,
-                    filter_branches=filter_branches,
-                    sort_by_branch=sort_by_branch,
-                    min_length=agg_dict.get("min_length", 1),
-                    max_length=agg_dict.get("max_length", 100),
+
+        # Create sort by branch selector
+        sort_by_branch = None
+        if sort_branch_dict:
+            branch_name = sort_branch_dict.get("branch")
+            if not branch_name:
+                raise ValueError(
+                    f"Missing 'branch' key in sort_by_branch for aggregator #{index}: {sort_branch_dict}"
                 )
-                feature_array_aggregators.append(aggregator)
-                logger.debug(f"Successfully created and added aggregator for dict #{i}")
-            else:
-                # This case might still be valid if the user intended an aggregator with 0 inputs (though unlikely)
-                # We could raise an error here too, or just log a warning.
-                # Let's log a warning instead of raising an error for empty input_branches,
-                # as the immediate cause (wrong branch type) is handled above.
-                logger.warning(
-                    f"Skipping aggregator creation for dict #{i} due to empty input_branches. "
-                    f"This might be due to invalid branch names or types being filtered out earlier."
+
+            branch = branches[branch_name]
+            if not branch.is_feature_array:
+                # Raise error if not a feature array
+                raise ValueError(
+                    f"Branch '{branch_name}' provided in 'sort_by_branch' for aggregator #{index} "
+                    f"is not a feature array (type: {branch.branch_type.value}). Aggregator sorting requires a feature array."
                 )
+            sort_by_branch = PhysliteFeatureArraySelector(
+                branch=branch
+            )  # This constructor also validates type
 
-        logger.debug(
-            f"after processing feature_array_aggregators length: {len(feature_array_aggregators)}"
-        )
-        # Create the selection config
-        try:
-            return PhysliteSelectionConfig(
-                name=config_dict.get("name", "Selection"),
-                feature_selectors=feature_selectors,
-                feature_array_aggregators=feature_array_aggregators,
+        if debug:
+            logger.debug(
+                f"Processed sort_by_branch for dict #{index}: {str(sort_by_branch)}"
             )
-        except ValueError:
-            # If there are no selectors or aggregators, return a minimal configuration
-            if not feature_selectors and not feature_array_aggregators:
-                # Try to create one feature selector as a fallback
-                for branch_name in config_dict.get("feature_selectors", []):
-                    try:
-                        branch = PhysliteBranch(branch_name)
-                        feature_selectors = [PhysliteFeatureSelector(branch=branch)]
-                        break
-                    except ValueError:
-                        continue
 
-            # Create with whatever we have
-            return PhysliteSelectionConfig(
-                name=config_dict.get("name", "Selection"),
-                feature_selectors=feature_selectors,
-                feature_array_aggregators=feature_array_aggregators,
+        # Create aggregator if we have input branches
+        # The check for empty input_branches is still relevant - an aggregator needs inputs.
+        if not input_branches:
+            # This case might still be valid if the user intended an aggregator with 0 inputs (though unlikely)
+            # Log a warning instead of raising an error for empty input_branches,
+            # as the immediate cause (wrong branch type) is handled above.
+            logger.warning(
+                f"Skipping aggregator creation for dict #{index} due to empty input_branches. "
+                f"This might be due to invalid branch names or types being filtered out earlier."
             )
+            return None
+
+        # PhysliteFeatureArrayAggregator constructor handles validation
+        aggregator = PhysliteFeatureArrayAggregator(
+            input_branches=input_branches,
+            filter_branches=filter_branches,
+            sort_by_branch=sort_by_branch,
+            min_length=min_length,
+            max_length=max_length,
+        )
+        if debug:
+            logger.debug(f"Successfully created aggregator for dict #{index}")
+        return aggregator
 
     @classmethod
     def create_from_branch_names(
@@ -391,26 +513,27 @@ class TaskConfig:
         # Create event filters
         event_filters = []
         for branch_name, range_dict in event_filter_dict.items():
-            try:
-                branch = PhysliteBranch(branch_name)
-                if branch.is_feature:
-                    # Need to ensure at least one of min/max is specified
-                    min_val = range_dict.get("min")
-                    max_val = range_dict.get("max")
-
-                    # If both are None, default to min=0 to satisfy requirements
-                    if min_val is None and max_val is None:
-                        min_val = 0
-
-                    event_filters.append(
-                        PhysliteFeatureFilter(
-                            branch=branch, min_value=min_val, max_value=max_val
-                        )
-                    )
-            except ValueError:
+            branch = _try_branch(branch_name)
+            if branch is None:
                 # Skip invalid branches
                 logger.warning(f"Invalid branch name: {branch_name}")
                 continue
+            if not branch.is_feature:
+                continue
+
+            # Need to ensure at least one of min/max is specified
+            min_val = range_dict.get("min")
+            max_val = range_dict.get("max")
+
+            # If both are None, default to min=0 to satisfy requirements
+            if min_val is None and max_val is None:
+                min_val = 0
+
+            event_filters.append(
+                PhysliteFeatureFilter(
+                    branch=branch, min_value=min_val, max_value=max_val
+                )
+            )
 
         # Create input configuration
         input_config = cls._create_selection_config_from_lists(
@@ -422,18 +545,17 @@ class TaskConfig:
         # Create label configurations
         label_configs = []
 
+        label_features = label_features or []
+        label_array_aggregators = label_array_aggregators or []
+
         # Determine the number of label configurations to create
-        n_labels = max(len(label_features or []), len(label_array_aggregators or []))
+        n_labels = max(len(label_features), len(label_array_aggregators))
 
         for i in range(n_labels):
             # Get the input for this label (or empty list)
-            feature_list = (
-                (label_features or [])[i] if i < len(label_features or []) else []
-            )
+            feature_list = label_features[i] if i < len(label_features) else []
             aggregator_list = (
-                (label_array_aggregators or [])[i]
-                if i < len(label_array_aggregators or [])
-                else []
+                label_array_aggregators[i] if i < len(label_array_aggregators) else []
             )
 
             # Create label configuration
@@ -456,133 +578,51 @@ class TaskConfig:
         feature_names: list[str], aggregator_list: list[dict[str, Any]], name: str
     ) -> PhysliteSelectionConfig:
         """Helper method to create a PhysliteSelectionConfig from lists of names and aggregator dicts."""
-        # Create feature selectors
-        feature_selectors = []
-        for branch_name in feature_names:
-            try:
-                branch = PhysliteBranch(branch_name)
-                if branch.is_feature:
-                    selector = PhysliteFeatureSelector(branch=branch)
-                    feature_selectors.append(selector)
-            except Exception:
-                continue
-
-        # Create feature array aggregators
-        feature_array_aggregators = []
-        logger.debug(f"aggregator_list length: {len(aggregator_list)}")
-        for i, agg_dict in enumerate(aggregator_list):
-            logger.debug(f"Processing aggregator dict #{i}: {agg_dict}")
-
-            # Create input branch selectors
-            input_branches = []
-            for branch_name in agg_dict.get("input_branches", []):
-                # Directly create and validate branch
-                branch = PhysliteBranch(
-                    branch_name
-                )  # Raises ValueError if name invalid
-                if not branch.is_feature_array:
-                    # Raise error if not a feature array
-                    raise ValueError(
-                        f"Branch '{branch_name}' provided in 'input_branches' for aggregator #{i} "
-                        f"is not a feature array (type: {branch.branch_type.value}). Aggregators require feature arrays."
-                    )
-                selector = PhysliteFeatureArraySelector(
-                    branch=branch
-                )  # This constructor also validates type
-                input_branches.append(selector)
-
-            logger.debug(
-                f"Processed input_branches for dict #{i}: {[str(b) for b in input_branches]}"
-            )
-
-            # Create filter branch filters
-            filter_branches = []
-            for filter_dict in agg_dict.get("filter_branches", []):
-                branch_name = filter_dict.get("branch")
-                if not branch_name:
-                    raise ValueError(
-                        f"Missing 'branch' key in filter_dict for aggregator #{i}: {filter_dict}"
-                    )
-
-                # Directly create and validate branch
-                branch = PhysliteBranch(
-                    branch_name
-                )  # Raises ValueError if name invalid
-                if not branch.is_feature_array:
-                    # Raise error if not a feature array
-                    raise ValueError(
-                        f"Branch '{branch_name}' provided in 'filter_branches' for aggregator #{i} "
-                        f"is not a feature array (type: {branch.branch_type.value}). Aggregator filters require feature arrays."
-                    )
-                filter_obj = PhysliteFeatureArrayFilter(
-                    branch=branch,
-                    min_value=filter_dict.get("min"),
-                    max_value=filter_dict.get("max"),
-                )  # This constructor also validates type
-                filter_branches.append(filter_obj)
+        return TaskConfig._build_selection_config(
+            name=name,
+            feature_selectors=TaskConfig._parse_feature_selectors(feature_names),
+            aggregator_list=aggregator_list,
+            fallback_names=feature_names,
+        )
 
-            logger.debug(
-                f"Processed filter_branches for dict #{i}: {[str(f) for f in filter_branches]}"
-            )
+    @staticmethod
+    def _build_selection_config(
+        name: str,
+        feature_selectors: list[PhysliteFeatureSelector],
+        aggregator_list: list[dict[str, Any]],
+        fallback_names: list[str],
+    ) -> PhysliteSelectionConfig:
+        """
+        Helper method to create a PhysliteSelectionConfig from parsed selectors and aggregator dicts.
 
-            # Create sort by branch selector
-            sort_branch_dict = agg_dict.get("sort_by_branch")
-            sort_by_branch = None
-            if sort_branch_dict:
-                branch_name = sort_branch_dict.get("branch")
-                if not branch_name:
-                    raise ValueError(
-                        f"Missing 'branch' key in sort_by_branch for aggregator #{i}: {sort_branch_dict}"
-                    )
+        Args:
+            name: Name of the selection configuration
+            feature_selectors: Scalar feature selectors
+            aggregator_list: List of aggregator definition dictionaries
+            fallback_names: Branch names to try for a single feature selector if
+                the configuration would otherwise be empty
 
-                # Directly create and validate branch
-                branch = PhysliteBranch(
-                    branch_name
-                )  # Raises ValueError if name invalid
-                if not branch.is_feature_array:
-                    # Raise error if not a feature array
-                    raise ValueError(
-                        f"Branch '{branch_name}' provided in 'sort_by_branch' for aggregator #{i} "
-                        f"is not a feature array (type: {branch.branch_type.value}). Aggregator sorting requires a feature array."
-                    )
-                sort_by_branch = PhysliteFeatureArraySelector(
-                    branch=branch
-                )  # This constructor also validates type
+        Returns:
+            New PhysliteSelectionConfig instance
+        """
+        # Debug messages are only formatted when debug logging is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-            logger.debug(
-                f"Processed sort_by_branch for dict #{i}: {str(sort_by_branch)}"
-            )
+        # Create feature array aggregators
+        if debug:
+            logger.debug(f"aggregator_list length: {len(aggregator_list)}")
+        branches = TaskConfig._resolve_aggregator_branches(aggregator_list)
+        feature_array_aggregators = [
+            aggregator
+            for i, agg_dict in enumerate(aggregator_list)
+            if (aggregator := TaskConfig._parse_aggregator_dict(agg_dict, i, branches))
+            is not None
+        ]
 
-            # Create aggregator if we have input branches
-            # The check for empty input_branches is still relevant - an aggregator needs inputs.
+        if debug:
             logger.debug(
-                f"Checking condition for dict #{i}: len(input_branches) = {len(input_branches)}"
+                f"after processing feature_array_aggregators length: {len(feature_array_aggregators)}"
             )
-            if input_branches:
-                # No need for try-except here anymore, PhysliteFeatureArrayAggregator constructor handles validation
-                logger.debug(f"Attempting to create aggregator for dict #{i}...")
-                aggregator = PhysliteFeatureArrayAggregator(
-                    input_branches=input_branches,
-                    filter_branches=filter_branches,
-                    sort_by_branch=sort_by_branch,
-                    min_length=agg_dict.get("min_length", 1),
-                    max_length=agg_dict.get("max_length", 100),
-                )
-                feature_array_aggregators.append(aggregator)
-                logger.debug(f"Successfully created and added aggregator for dict #{i}")
-            else:
-                # This case might still be valid if the user intended an aggregator with 0 inputs (though unlikely)
-                # We could raise an error here too, or just log a warning.
-                # Let's log a warning instead of raising an error for empty input_branches,
-                # as the immediate cause (wrong branch type) is handled above.
-                logger.warning(
-                    f"Skipping aggregator creation for dict #{i} due to empty input_branches. "
-                    f"This might be due to invalid branch names or types being filtered out earlier."
-                )
-
-        logger.debug(
-            f"after processing feature_array_aggregators length: {len(feature_array_aggregators)}"
-        )
         # Create the selection config
         try:
             return PhysliteSelectionConfig(
@@ -594,9 +634,9 @@ class TaskConfig:
             # If there are no selectors or aggregators, return a minimal configuration
             if not feature_selectors and not feature_array_aggregators:
                 # Try to create one feature selector as a fallback
-                for branch_name in feature_names:
+                for branch_name in fallback_names:
                     try:
-                        branch = PhysliteBranch(branch_name)
+                        branch = _branch(branch_name)
                         feature_selectors = [PhysliteFeatureSelector(branch=branch)]
                         break
                     except ValueError:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Union
 
 from hep_foundation.config.logging_config import get_logger
 
@@ -13,6 +13,11 @@ class TrainingConfig:
     learning_rate: float
     early_stopping: dict[str, Any]
     plot_training: bool
+    mixed_precision: Union[bool, str]
+
+    # Keras dtype policies accepted as the mixed_precision setting (True selects
+    # mixed_float16, False trains in float32)
+    MIXED_PRECISION_POLICIES = ("mixed_float16", "mixed_bfloat16")
 
     def __init__(
         self,
@@ -22,6 +27,7 @@ class TrainingConfig:
         early_stopping_patience: int,
         early_stopping_min_delta: float,
         plot_training: bool,
+        mixed_precision: Union[bool, str] = True,
     ):
         self.logger = get_logger(__name__)
         self.batch_size = batch_size
@@ -32,6 +38,7 @@ class TrainingConfig:
             "min_delta": early_stopping_min_delta,
         }
         self.plot_training = plot_training
+        self.mixed_precision = mixed_precision
 
     def validate(self) -> None:
         """Validate training configuration parameters"""
@@ -43,6 +50,12 @@ class TrainingConfig:
             raise ValueError("early_stopping_patience must be non-negative")
         if self.early_stopping["min_delta"] < 0:
             raise ValueError("early_stopping_min_delta must be non-negative")
+        if not isinstance(self.mixed_precision, bool) and (
+            self.mixed_precision not in self.MIXED_PRECISION_POLICIES
+        ):
+            raise ValueError(
+                f"mixed_precision must be a boolean or one of {self.MIXED_PRECISION_POLICIES}"
+            )
 
     def to_dict(self) -> dict:
         """
@@ -57,4 +70,5 @@ class TrainingConfig:
             "learning_rate": self.learning_rate,
             "early_stopping": self.early_stopping,
             "plot_training": self.plot_training,
+            "mixed_precision": self.mixed_precision,
         }
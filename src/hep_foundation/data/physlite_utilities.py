@@ -1,17 +1,86 @@
+import ast
+import functools
 import json
 import logging
+import sys
+from collections.abc import Sequence
 from enum import Enum
 from importlib import resources
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
-# Import functions to check and retrieve derived feature definitions
-from hep_foundation.data.physlite_derived_features import (
-    get_derived_feature,
-    is_derived_feature,
-)
+# Import derived feature definitions
+from hep_foundation.data.physlite_derived_features import DERIVED_FEATURE_REGISTRY
 
 logger = logging.getLogger(__name__)
 
+
+@functools.cache
+def _warn_once(message: str) -> None:
+    """Log a warning only the first time a given message is seen."""
+    logger.warning(message)
+
+
+class BranchType(Enum):
+    """Enum for branch types based on their shape."""
+
+    UNKNOWN = "unknown"
+    FEATURE = "feature"  # Scalar value (single value per event)
+    FEATURE_ARRAY = "feature_array"  # Array value (multiple values per event)
+
+
+class BranchInfo(NamedTuple):
+    """Compact, immutable branch information (from the index or a derived feature)."""
+
+    shape: Optional[tuple[int, ...]]
+    dtype: Optional[str]
+    status: str
+    branch_type: BranchType
+
+
+def _determine_branch_type(shape: Optional[tuple[int, ...]]) -> BranchType:
+    """Helper function to determine branch type from its (parsed) shape."""
+    if shape is None:
+        return BranchType.UNKNOWN
+
+    # Empty tuple or tuple with zeros indicates a scalar (feature)
+    if not shape or shape == () or shape == (0,):
+        return BranchType.FEATURE
+
+    # Non-empty shape indicates an array (feature_array)
+    return BranchType.FEATURE_ARRAY
+
+
+def _parse_shape(shape: Any) -> Optional[tuple[int, ...]]:
+    """Convert a shape from the branch index (list, tuple string or None) to a tuple."""
+    if isinstance(shape, str):
+        try:
+            # Handle tuple string like "()" or "(10,)"
+            shape = ast.literal_eval(shape)
+        except (ValueError, SyntaxError):
+            return None
+    if shape is None:
+        return None
+    try:
+        return tuple(shape)
+    except TypeError:
+        return None
+
+
+def _make_branch_info(info: dict[str, Any]) -> BranchInfo:
+    """Convert a branch information dictionary to a BranchInfo tuple."""
+    shape = _parse_shape(info.get("shape"))
+    return BranchInfo(
+        shape=shape,
+        dtype=info.get("dtype"),
+        status=info.get("status", "unknown"),
+        branch_type=_determine_branch_type(shape),
+    )
+
+
+# Branch info keyed by full branch name ("Category.feature"). Branches in the
+# "Other" category are also keyed by their bare feature name.
+PHYSLITE_BRANCHES_FLAT: dict[str, BranchInfo] = {}
+
 # Load the branch index data from the JSON file
 try:
     # Use importlib.resources for robust path finding within the package
@@ -26,6 +95,15 @@ try:
     ):
         data = json.load(f)
         PHYSLITE_BRANCHES = data["physlite_branches"]
+        for category, category_branches in PHYSLITE_BRANCHES.items():
+            for feature, info_dict in category_branches.items():
+                # Parse the shape and determine the branch type only once here,
+                # storing the result as a compact tuple instead of a dict
+                info = category_branches[feature] = _make_branch_info(info_dict)
+                # Interned keys let lookups with interned names match by identity
+                PHYSLITE_BRANCHES_FLAT[sys.intern(f"{category}.{feature}")] = info
+                if category == "Other" and "." not in feature:
+                    PHYSLITE_BRANCHES_FLAT[sys.intern(feature)] = info
         logger.info(f"Successfully loaded PhysLite branch index from {json_path_str}")
         # Optionally log metadata:
         # generation_info = data.get("generation_info", {})
@@ -40,20 +118,16 @@ except (json.JSONDecodeError, KeyError) as e:
     PHYSLITE_BRANCHES = {}
 
 
-class BranchType(Enum):
-    """Enum for branch types based on their shape."""
-
-    UNKNOWN = "unknown"
-    FEATURE = "feature"  # Scalar value (single value per event)
-    FEATURE_ARRAY = "feature_array"  # Array value (multiple values per event)
-
-
+@functools.lru_cache(maxsize=4096)
 def get_branch_info(
     branch_name: str,
-) -> tuple[bool, BranchType, Optional[dict[str, Any]]]:
+) -> tuple[bool, BranchType, Optional[BranchInfo]]:
     """
     Check if a branch name is valid (either real or derived) and determine its type.
 
+    Results are cached per branch name, so the returned (immutable) branch
+    information is shared between callers.
+
     Args:
         branch_name: Full branch name (e.g., "InDetTrackParticlesAuxDyn.d0" or "derived.XYZ")
 
@@ -61,29 +135,21 @@ def get_branch_info(
         Tuple containing:
         - Boolean indicating if branch exists (or is a known derived feature)
         - BranchType enum value based on shape (real or derived)
-        - Dictionary with branch information (from index or constructed for derived)
+        - BranchInfo with branch information (from index or constructed for derived)
 
     Raises:
         RuntimeError: If branch index is not available and the branch is not derived.
     """
-    # First, check if it's a known derived feature
-    if is_derived_feature(branch_name):
-        derived_feature = get_derived_feature(branch_name)
-        if derived_feature:
-            # Get the constructed branch info dict (shape, dtype, status)
-            branch_info_dict = derived_feature.get_branch_info_dict()
-            # Determine the branch type from the derived feature's shape
-            branch_type = _determine_branch_type(branch_info_dict)
-            logger.info(
-                f"Branch '{branch_name}' identified as derived: type={branch_type}, info={branch_info_dict}"
-            )
-            return True, branch_type, branch_info_dict
-        else:
-            # Should not happen if is_derived_feature is True, but handle defensively
-            logger.warning(
-                f"Branch '{branch_name}' flagged as derived but definition not found."
-            )
-            return False, BranchType.UNKNOWN, None
+    # First, check if it's a known derived feature (None if not derived)
+    derived_feature = DERIVED_FEATURE_REGISTRY.get(branch_name)
+    if derived_feature is not None:
+        # Build the branch info (shape, dtype, status) and determine the
+        # branch type from the derived feature's shape
+        branch_info = _make_branch_info(derived_feature.get_branch_info_dict())
+        logger.info(
+            f"Branch '{branch_name}' identified as derived: type={branch_info.branch_type}, info={branch_info}"
+        )
+        return True, branch_info.branch_type, branch_info
 
     # If not derived, proceed to check the PhysLite index file
     if not PHYSLITE_BRANCHES:
@@ -93,24 +159,11 @@ def get_branch_info(
             "Please ensure the branch index is properly installed and accessible."
         )
 
-    # Extract category and feature name for index lookup
-    branch_name_str: str = branch_name  # Ensure it's a string
-    category: Optional[str] = None
-    feature: str = branch_name_str
-
-    if "." in branch_name_str:
-        category, feature = branch_name_str.split(".", 1)
+    # Check if the branch exists in the loaded index (names without a dot
+    # refer to the 'Other' category)
+    branch_info = PHYSLITE_BRANCHES_FLAT.get(branch_name)
 
-    # Check if the branch exists in the loaded dictionary
-    branch_info: Optional[dict[str, Any]] = None
-    if category:
-        if category in PHYSLITE_BRANCHES and feature in PHYSLITE_BRANCHES[category]:
-            branch_info = PHYSLITE_BRANCHES[category][feature]
-    else:  # Assume 'Other' category if no dot
-        if "Other" in PHYSLITE_BRANCHES and feature in PHYSLITE_BRANCHES["Other"]:
-            branch_info = PHYSLITE_BRANCHES["Other"][feature]
-
-    if not branch_info:
+    if branch_info is None:
         # It wasn't derived and wasn't found in the index
         logger.warning(
             f"Branch '{branch_name}' not found in PHYSLITE_BRANCHES index and is not a known derived feature."
@@ -118,40 +171,15 @@ def get_branch_info(
         return False, BranchType.UNKNOWN, None
 
     # Check status (only for branches found in the index)
-    status = branch_info.get("status", "unknown")
-    if status != "success":
+    if branch_info.status != "success":
         logger.warning(
-            f"Branch '{branch_name}' has status '{status}' in index. Treating as invalid."
+            f"Branch '{branch_name}' has status '{branch_info.status}' in index. Treating as invalid."
         )
         return False, BranchType.UNKNOWN, None
 
-    # Determine branch type from shape information (only for branches found in the index)
-    branch_type = _determine_branch_type(branch_info)
-
     # If we reached here, it's a valid branch from the index file
-    return True, branch_type, branch_info
-
-
-def _determine_branch_type(branch_info: dict[str, Any]) -> BranchType:
-    """Helper function to determine branch type from its info."""
-    if "shape" not in branch_info or branch_info["shape"] is None:
-        return BranchType.UNKNOWN
-
-    # Convert string representation of shape to tuple if needed
-    shape = branch_info["shape"]
-    if isinstance(shape, str):
-        try:
-            # Handle tuple string like "()" or "(10,)"
-            shape = eval(shape)
-        except Exception:
-            return BranchType.UNKNOWN
-
-    # Empty tuple or tuple with zeros indicates a scalar (feature)
-    if not shape or shape == () or shape == (0,):
-        return BranchType.FEATURE
-
-    # Non-empty shape indicates an array (feature_array)
-    return BranchType.FEATURE_ARRAY
+    # (its type was determined from the shape when the index was loaded)
+    return True, branch_info.branch_type, branch_info
 
 
 class PhysliteBranch:
@@ -163,9 +191,11 @@ class PhysliteBranch:
         category: The category part of the branch name
         feature: The feature part of the branch name
         branch_type: The type of branch (feature or feature_array)
-        info: Additional information about the branch
+        info: BranchInfo with the shape, dtype, status and type of the branch
     """
 
+    __slots__ = ("name", "branch_type", "info", "category", "feature")
+
     def __init__(self, branch_name: str):
         """
         Initialize a PhysliteBranch object.
@@ -181,7 +211,36 @@ class PhysliteBranch:
         if not is_valid:
             raise ValueError(f"Invalid branch name: {branch_name}")
 
-        self.name = branch_name
+        self._set_branch_info(branch_name, branch_type, branch_info)
+
+    @classmethod
+    def try_create(cls, branch_name: str) -> Optional["PhysliteBranch"]:
+        """
+        Create a PhysliteBranch, returning None instead of raising for invalid names.
+
+        Args:
+            branch_name: Full branch name (e.g., "InDetTrackParticlesAuxDyn.d0")
+
+        Returns:
+            PhysliteBranch object, or None if the branch name is invalid
+        """
+        is_valid, branch_type, branch_info = get_branch_info(branch_name)
+
+        if not is_valid:
+            return None
+
+        branch = cls.__new__(cls)
+        branch._set_branch_info(branch_name, branch_type, branch_info)
+        return branch
+
+    def _set_branch_info(
+        self,
+        branch_name: str,
+        branch_type: BranchType,
+        branch_info: BranchInfo,
+    ) -> None:
+        """Store the validated branch information on this object."""
+        self.name = sys.intern(str(branch_name))
         self.branch_type = branch_type
         self.info = branch_info
 
@@ -210,18 +269,7 @@ class PhysliteBranch:
 
     def get_shape(self) -> Optional[tuple[int, ...]]:
         """Get the shape of this branch if available."""
-        if not self.info or "shape" not in self.info:
-            return None
-
-        shape = self.info["shape"]
-        if isinstance(shape, str):
-            try:
-                # Handle tuple string like "()" or "(10,)"
-                shape = eval(shape)
-            except Exception:
-                return None
-
-        return shape
+        return self.info.shape
 
 
 class PhysliteFeatureSelector:
@@ -232,6 +280,8 @@ class PhysliteFeatureSelector:
         branch: The PhysliteBranch to select
     """
 
+    __slots__ = ("branch",)
+
     def __init__(self, branch: PhysliteBranch):
         """
         Initialize a feature selector.
@@ -255,6 +305,10 @@ class PhysliteFeatureSelector:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary."""
+        return {"branch_name": self.branch.name}
+
 
 class PhysliteFeatureArraySelector:
     """
@@ -264,6 +318,8 @@ class PhysliteFeatureArraySelector:
         branch: The PhysliteBranch to select
     """
 
+    __slots__ = ("branch",)
+
     def __init__(self, branch: PhysliteBranch):
         """
         Initialize a feature array selector.
@@ -287,6 +343,10 @@ class PhysliteFeatureArraySelector:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary."""
+        return {"branch_name": self.branch.name}
+
 
 class PhysliteFeatureFilter:
     """
@@ -298,6 +358,8 @@ class PhysliteFeatureFilter:
         max_value: Maximum allowed value (None means no maximum)
     """
 
+    __slots__ = ("branch", "min_value", "max_value")
+
     def __init__(
         self,
         branch: PhysliteBranch,
@@ -328,13 +390,23 @@ class PhysliteFeatureFilter:
         self.max_value = max_value
 
     def __str__(self) -> str:
-        min_str = str(self.min_value) if self.min_value is not None else "-∞"
-        max_str = str(self.max_value) if self.max_value is not None else "∞"
-        return f"FeatureFilter({self.branch.name}, range=[{min_str}, {max_str}])"
+        return (
+            f"FeatureFilter({self.branch.name}, range=["
+            f"{self.min_value if self.min_value is not None else '-∞'}, "
+            f"{self.max_value if self.max_value is not None else '∞'}])"
+        )
 
     def __repr__(self) -> str:
         return self.__str__()
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary."""
+        return {
+            "branch_name": self.branch.name,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+        }
+
 
 class PhysliteFeatureArrayFilter:
     """
@@ -346,6 +418,8 @@ class PhysliteFeatureArrayFilter:
         max_value: Maximum allowed value (None means no maximum)
     """
 
+    __slots__ = ("branch", "min_value", "max_value")
+
     def __init__(
         self,
         branch: PhysliteBranch,
@@ -376,13 +450,52 @@ class PhysliteFeatureArrayFilter:
         self.max_value = max_value
 
     def __str__(self) -> str:
-        min_str = str(self.min_value) if self.min_value is not None else "-∞"
-        max_str = str(self.max_value) if self.max_value is not None else "∞"
-        return f"FeatureArrayFilter({self.branch.name}, range=[{min_str}, {max_str}])"
+        return (
+            f"FeatureArrayFilter({self.branch.name}, range=["
+            f"{self.min_value if self.min_value is not None else '-∞'}, "
+            f"{self.max_value if self.max_value is not None else '∞'}])"
+        )
 
     def __repr__(self) -> str:
         return self.__str__()
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary."""
+        return {
+            "branch_name": self.branch.name,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+        }
+
+
+def _selector_k(selector: PhysliteFeatureArraySelector) -> int:
+    """Determine the feature multiplicity (k) per track from a selector's branch shape."""
+    branch_shape = selector.branch.get_shape()
+    if branch_shape is None:
+        _warn_once(
+            f"Branch '{selector.branch.name}' has no shape info available. Assuming k=1."
+        )
+        return 1
+    if len(branch_shape) == 1:
+        # Shape like (-1,) or (N,) -> k=1 feature per track
+        return 1
+    if len(branch_shape) == 2:
+        # Shape like (-1, k) or (N, k) -> k features per track
+        # Use the second dimension as k
+        k = branch_shape[1]
+        if k <= 0:
+            # Handle cases like shape [-1, 0] or [-1, -1] if they occur
+            _warn_once(
+                f"Branch '{selector.branch.name}' has non-positive inner dimension {k} in shape {branch_shape}. Assuming k=1."
+            )
+            return 1
+        return k
+    # Unexpected shape dimensions (e.g., 0D or 3D+ for an aggregator input)
+    _warn_once(
+        f"Branch '{selector.branch.name}' has unexpected shape {branch_shape} for feature size calculation. Assuming k=1."
+    )
+    return 1
+
 
 class PhysliteFeatureArrayAggregator:
     """
@@ -392,17 +505,30 @@ class PhysliteFeatureArrayAggregator:
     and aggregating feature arrays from PhysLite events.
 
     Attributes:
-        input_branches: List of feature array selectors for input data collection
-        filter_branches: List of feature array filters for filtering data
+        input_branches: Tuple of feature array selectors for input data collection
+        filter_branches: Tuple of feature array filters for filtering data
         sort_by_branch: Feature array selector to use for sorting (typically pT), or None to keep original order
         min_length: Minimum number of array elements required after filtering
         max_length: Maximum number of array elements to keep (truncation/padding size)
+        feature_count_per_track: Total number of features per array element over all input branches
     """
 
+    __slots__ = (
+        "input_branches",
+        "filter_branches",
+        "sort_by_branch",
+        "min_length",
+        "max_length",
+        "input_branch_names",
+        "filter_branch_names",
+        "sort_by_branch_name",
+        "feature_count_per_track",
+    )
+
     def __init__(
         self,
-        input_branches: list[PhysliteFeatureArraySelector],
-        filter_branches: list[PhysliteFeatureArrayFilter],
+        input_branches: Sequence[PhysliteFeatureArraySelector],
+        filter_branches: Sequence[PhysliteFeatureArrayFilter],
         sort_by_branch: Optional[PhysliteFeatureArraySelector] = None,
         min_length: int = 1,
         max_length: int = 100,
@@ -434,19 +560,23 @@ class PhysliteFeatureArrayAggregator:
                 f"min_length ({min_length}) cannot be greater than max_length ({max_length})"
             )
 
-        self.input_branches = input_branches
-        self.filter_branches = filter_branches
+        # Stored as tuples since the configuration is immutable after construction
+        self.input_branches = tuple(input_branches)
+        self.filter_branches = tuple(filter_branches)
         self.sort_by_branch = sort_by_branch
         self.min_length = min_length
         self.max_length = max_length
 
         # Get branch names for easier reference
-        self.input_branch_names = [f.branch.name for f in input_branches]
-        self.filter_branch_names = [f.branch.name for f in filter_branches]
+        self.input_branch_names = tuple(f.branch.name for f in input_branches)
+        self.filter_branch_names = tuple(f.branch.name for f in filter_branches)
         self.sort_by_branch_name = (
             sort_by_branch.branch.name if sort_by_branch is not None else None
         )
 
+        # Features per array element, derived once from the input branch shapes
+        self.feature_count_per_track = sum(_selector_k(s) for s in self.input_branches)
+
     def __str__(self) -> str:
         input_str = ", ".join(self.input_branch_names)
         filter_str = (
@@ -465,6 +595,20 @@ class PhysliteFeatureArrayAggregator:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary."""
+        return {
+            "input_branches": [b.to_dict() for b in self.input_branches],
+            "filter_branches": [f.to_dict() for f in self.filter_branches],
+            "sort_by_branch": (
+                self.sort_by_branch.to_dict()
+                if self.sort_by_branch is not None
+                else None
+            ),
+            "min_length": self.min_length,
+            "max_length": self.max_length,
+        }
+
 
 class PhysliteSelectionConfig:
     """
@@ -474,15 +618,22 @@ class PhysliteSelectionConfig:
     to extract from PhysLite data processing. Filtering is handled separately.
 
     Attributes:
-        feature_selectors: List of scalar feature selectors for individual values
-        feature_array_aggregators: List of feature array aggregators for collecting arrays
+        feature_selectors: Tuple of scalar feature selectors for individual values
+        feature_array_aggregators: Tuple of feature array aggregators for collecting arrays
         name: Optional name for this configuration
     """
 
+    __slots__ = (
+        "feature_selectors",
+        "feature_array_aggregators",
+        "name",
+        "_total_feature_size",
+    )
+
     def __init__(
         self,
-        feature_selectors: list[PhysliteFeatureSelector] = None,
-        feature_array_aggregators: list[PhysliteFeatureArrayAggregator] = None,
+        feature_selectors: Sequence[PhysliteFeatureSelector] = None,
+        feature_array_aggregators: Sequence[PhysliteFeatureArrayAggregator] = None,
         name: str = "PhysliteSelection",
     ):
         """
@@ -496,9 +647,10 @@ class PhysliteSelectionConfig:
         Raises:
             ValueError: If no selectors or aggregators are provided
         """
-        self.feature_selectors = feature_selectors or []
-        self.feature_array_aggregators = feature_array_aggregators or []
+        self.feature_selectors = tuple(feature_selectors or ())
+        self.feature_array_aggregators = tuple(feature_array_aggregators or ())
         self.name = name
+        self._total_feature_size: Optional[int] = None
 
         # Ensure at least one selector or aggregator is provided
         if not (self.feature_selectors or self.feature_array_aggregators):
@@ -516,6 +668,16 @@ class PhysliteSelectionConfig:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary."""
+        return {
+            "name": self.name,
+            "feature_selectors": [s.to_dict() for s in self.feature_selectors],
+            "feature_array_aggregators": [
+                a.to_dict() for a in self.feature_array_aggregators
+            ],
+        }
+
     def get_total_feature_size(self) -> int:
         """
         Calculate total feature size by combining scalar features and aggregated array features.
@@ -523,48 +685,12 @@ class PhysliteSelectionConfig:
         Returns:
             int: Total number of features, calculated as:
                  (number of scalar features) +
-                 sum(aggregator.max_length * len(aggregator.input_branches) for each aggregator)
+                 sum(aggregator.max_length * aggregator.feature_count_per_track for each aggregator)
         """
-        # Count scalar features
-        total_size = len(self.feature_selectors)
-
-        # Add size from each aggregator
-        for aggregator in self.feature_array_aggregators:
-            # Calculate size contributed by this aggregator's inputs
-            aggregator_feature_count_per_track = 0
-            for selector in aggregator.input_branches:
-                # --- Determine feature multiplicity (k) from branch shape ---
-                branch_shape = selector.branch.get_shape()
-                k = 1  # Default to 1 feature
-                if branch_shape is not None:
-                    if len(branch_shape) == 1:
-                        # Shape like (-1,) or (N,) -> k=1 feature per track
-                        k = 1
-                    elif len(branch_shape) == 2:
-                        # Shape like (-1, k) or (N, k) -> k features per track
-                        # Use the second dimension as k
-                        k = branch_shape[1]
-                        if k <= 0:
-                            # Handle cases like shape [-1, 0] or [-1, -1] if they occur
-                            logger.warning(
-                                f"Branch '{selector.branch.name}' has non-positive inner dimension {k} in shape {branch_shape}. Assuming k=1."
-                            )
-                            k = 1
-                    else:
-                        # Unexpected shape dimensions (e.g., 0D or 3D+ for an aggregator input)
-                        logger.warning(
-                            f"Branch '{selector.branch.name}' has unexpected shape {branch_shape} for feature size calculation. Assuming k=1."
-                        )
-                        k = 1
-                else:
-                    logger.warning(
-                        f"Branch '{selector.branch.name}' has no shape info available. Assuming k=1."
-                    )
-
-                aggregator_feature_count_per_track += k
-
-            # Multiply total features per track by max_length for this aggregator
-            aggregator_size = aggregator.max_length * aggregator_feature_count_per_track
-            total_size += aggregator_size
-
-        return total_size
+        # The configuration does not change after construction, so compute once
+        if self._total_feature_size is None:
+            self._total_feature_size = len(self.feature_selectors) + sum(
+                aggregator.max_length * aggregator.feature_count_per_track
+                for aggregator in self.feature_array_aggregators
+            )
+        return self._total_feature_size
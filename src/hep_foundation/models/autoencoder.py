@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +20,8 @@ class AutoEncoderConfig(ModelConfig):
         Raises:
             ValueError: If configuration is invalid
         """
+        architecture = self.architecture
+
         # Check required architecture parameters
         required_arch = [
             "input_shape",
@@ -27,48 +30,62 @@ class AutoEncoderConfig(ModelConfig):
             "decoder_layers",
         ]
         for param in required_arch:
-            if param not in self.architecture:
+            if param not in architecture:
                 raise ValueError(f"Missing required architecture parameter: {param}")
 
         # Validate architecture parameter values
-        if self.architecture["latent_dim"] < 1:
+        if architecture["latent_dim"] < 1:
             raise ValueError("latent_dim must be positive")
 
         if (
-            not isinstance(self.architecture["encoder_layers"], list)
-            or not self.architecture["encoder_layers"]
+            not isinstance(architecture["encoder_layers"], list)
+            or not architecture["encoder_layers"]
         ):
             raise ValueError("encoder_layers must be a non-empty list")
 
         if (
-            not isinstance(self.architecture["decoder_layers"], list)
-            or not self.architecture["decoder_layers"]
+            not isinstance(architecture["decoder_layers"], list)
+            or not architecture["decoder_layers"]
         ):
             raise ValueError("decoder_layers must be a non-empty list")
 
-        if not isinstance(self.architecture["input_shape"], (tuple, list)):
+        if not isinstance(architecture["input_shape"], (tuple, list)):
             raise ValueError("input_shape must be a tuple or list")
 
-        # Validate layer sizes
-        for i, size in enumerate(self.architecture["encoder_layers"]):
-            if not isinstance(size, int) or size < 1:
-                raise ValueError(f"encoder_layers[{i}] must be a positive integer")
-
-        for i, size in enumerate(self.architecture["decoder_layers"]):
-            if not isinstance(size, int) or size < 1:
-                raise ValueError(f"decoder_layers[{i}] must be a positive integer")
+        # Validate layer sizes, reporting the first invalid entry of each list
+        for name in ("encoder_layers", "decoder_layers"):
+            bad_index = next(
+                (
+                    i
+                    for i, size in enumerate(architecture[name])
+                    if not isinstance(size, int) or size < 1
+                ),
+                None,
+            )
+            if bad_index is not None:
+                raise ValueError(f"{name}[{bad_index}] must be a positive integer")
 
         # Validate activation function
-        if "activation" in self.architecture:
+        if "activation" in architecture:
             valid_activations = ["relu", "tanh", "sigmoid", "elu", "selu"]
-            if self.architecture["activation"] not in valid_activations:
+            if architecture["activation"] not in valid_activations:
                 raise ValueError(f"activation must be one of {valid_activations}")
 
         # Validate normalize_latent
-        if "normalize_latent" in self.architecture:
-            if not isinstance(self.architecture["normalize_latent"], bool):
+        if "normalize_latent" in architecture:
+            if not isinstance(architecture["normalize_latent"], bool):
                 raise ValueError("normalize_latent must be a boolean")
 
+        # Validate plot_architecture
+        if "plot_architecture" in architecture:
+            if not isinstance(architecture["plot_architecture"], bool):
+                raise ValueError("plot_architecture must be a boolean")
+
+        # Validate jit_compile
+        if "jit_compile" in architecture:
+            if not isinstance(architecture["jit_compile"], bool):
+                raise ValueError("jit_compile must be a boolean")
+
         # Validate hyperparameters
         if "quant_bits" in self.hyperparameters:
             if not isinstance(self.hyperparameters["quant_bits"], (int, type(None))):
@@ -98,16 +115,25 @@ class AutoEncoder(BaseModel):
         self.decoder_layers = config.architecture["decoder_layers"]
         self.activation = config.architecture.get("activation", "relu")
         self.normalize_latent = config.architecture.get("normalize_latent", False)
+        # Plotting the architecture with Graphviz is slow, so it is opt-in
+        self.plot_architecture = config.architecture.get("plot_architecture", False)
+        # Compile train/test/predict steps with XLA, fusing the dense blocks
+        self.jit_compile = config.architecture.get("jit_compile", False)
         self.name = config.architecture.get("name", "track_autoencoder")
 
     def build(self, input_shape: tuple = None) -> None:
         """Build encoder and decoder networks"""
+        if input_shape is None:
+            input_shape = self.input_shape
+        # Static tuple shape (the config may provide a list)
+        input_shape = tuple(input_shape)
+        flat_size = int(np.prod(input_shape))
 
         # Input layer - now accepts 3D input (batch_size, n_tracks, n_features)
         inputs = keras.Input(shape=input_shape, name="input_layer")
 
         # Flatten the input to combine tracks and features
-        x = keras.layers.Reshape((-1,))(
+        x = keras.layers.Flatten(name="flatten_input")(
             inputs
         )  # Flatten to (batch_size, n_tracks * n_features)
 
@@ -129,21 +155,30 @@ class AutoEncoder(BaseModel):
         for i, units in enumerate(self.decoder_layers):
             x = self._add_dense_block(x, units, f"decoder_{i}")
 
-        # Output layer - reshape back to original dimensions
-        x = keras.layers.Dense(np.prod(input_shape), name="output_dense")(x)
+        # Output layer - reshape back to original dimensions. Always float32 so
+        # the reconstruction loss is numerically stable when the trainer enables
+        # mixed precision (the hidden layers follow the global dtype policy).
+        x = keras.layers.Dense(flat_size, dtype="float32", name="output_dense")(x)
 
         # Reshape back to 3D
-        outputs = keras.layers.Reshape(input_shape, name="output_reshape")(x)
+        outputs = keras.layers.Reshape(
+            input_shape, dtype="float32", name="output_reshape"
+        )(x)
 
         # Create model
         self.model = keras.Model(inputs=inputs, outputs=outputs, name=self.name)
 
     def _add_dense_block(self, x, units: int, prefix: str):
-        """Helper to add a dense block with activation and batch norm"""
-        x = keras.layers.Dense(units, name=f"{prefix}_dense")(x)
-        x = keras.layers.Activation(self.activation, name=f"{prefix}_activation")(x)
+        """Helper to add a dense block with batch norm and activation
 
-        return keras.layers.BatchNormalization(name=f"{prefix}_bn")(x)
+        Batch norm directly follows the dense layer so it can be folded into the
+        dense weights at inference time. The dense bias is redundant with the
+        batch norm offset (beta) and is therefore disabled.
+        """
+        x = keras.layers.Dense(units, use_bias=False, name=f"{prefix}_dense")(x)
+        x = keras.layers.BatchNormalization(name=f"{prefix}_bn")(x)
+
+        return keras.layers.Activation(self.activation, name=f"{prefix}_activation")(x)
 
     def create_plots(
         self, plots_dir: Path, training_history_json_path: Optional[Path] = None
@@ -157,17 +192,34 @@ class AutoEncoder(BaseModel):
         self.logger.info("Creating autoencoder-specific plots...")
 
         # Example: Plot model architecture
+        if self.plot_architecture:
+            self._plot_model_architecture(plots_dir / "model_architecture.png")
+
+        # Could add more autoencoder-specific visualizations:
+        # - Latent space clustering
+        # - Reconstruction quality examples
+        # - Feature-wise reconstruction errors
+
+    def _plot_model_architecture(self, plot_path: Path) -> None:
+        """Plot the model architecture with Graphviz, if it is available"""
+        # plot_model needs pydot and the Graphviz 'dot' executable
+        try:
+            import pydot  # noqa: F401
+        except ImportError:
+            self.logger.warning("pydot not installed, skipping model architecture plot")
+            return
+        if shutil.which("dot") is None:
+            self.logger.warning(
+                "Graphviz 'dot' not found, skipping model architecture plot"
+            )
+            return
+
         tf.keras.utils.plot_model(
             self.model,
-            to_file=str(plots_dir / "model_architecture.png"),
+            to_file=str(plot_path),
             show_shapes=True,
             show_layer_names=True,
             expand_nested=True,
         )
 
         self.logger.info("Created model architecture plot")
-
-        # Could add more autoencoder-specific visualizations:
-        # - Latent space clustering
-        # - Reconstruction quality examples
-        # - Feature-wise reconstruction errors
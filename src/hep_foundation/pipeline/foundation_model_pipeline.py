@@ -1192,6 +1192,7 @@ class FoundationModelPipeline:
                     "batch_size": dnn_training_config.batch_size,
                     "epochs": fixed_epochs,  # Use fixed epochs for fair comparison
                     "learning_rate": dnn_training_config.learning_rate,
+                    "mixed_precision": dnn_training_config.mixed_precision,
                     "early_stopping": {
                         "patience": fixed_epochs + 1,
                         "min_delta": 0,
@@ -1995,6 +1996,7 @@ class FoundationModelPipeline:
                     "batch_size": dnn_training_config.batch_size,
                     "epochs": fixed_epochs,  # Use fixed epochs for fair comparison
                     "learning_rate": dnn_training_config.learning_rate,
+                    "mixed_precision": dnn_training_config.mixed_precision,
                     "early_stopping": {
                         "patience": fixed_epochs + 1,
                         "min_delta": 0,
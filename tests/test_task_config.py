@@ -0,0 +1,51 @@
+import json
+import math
+
+from hep_foundation.config.task_config import TaskConfig
+
+EVENT_FILTER_BRANCH = "EventInfoAuxDyn.averageInteractionsPerCrossing"
+INPUT_FEATURE = "EventInfoAuxDyn.eventNumber"
+
+
+def test_load_non_finite_filter_bounds(tmp_path):
+    """Configs with Infinity/NaN bounds (as written by the stdlib) can be loaded"""
+    config_path = tmp_path / "task_config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "event_filters": [
+                    {
+                        "branch_name": EVENT_FILTER_BRANCH,
+                        "min_value": 0.0,
+                        "max_value": math.inf,
+                    }
+                ],
+                "input": {
+                    "name": "Input",
+                    "feature_selectors": [{"branch_name": INPUT_FEATURE}],
+                },
+                "labels": [],
+            }
+        )
+    )
+
+    loaded = TaskConfig.load(config_path)
+
+    assert loaded.event_filters[0].min_value == 0.0
+    assert loaded.event_filters[0].max_value == math.inf
+
+
+def test_save_load_round_trip_non_finite_filter_bounds(tmp_path):
+    """Infinite filter bounds survive a save/load round trip"""
+    task_config = TaskConfig.create_from_branch_names(
+        event_filter_dict={EVENT_FILTER_BRANCH: {"min": -math.inf, "max": math.inf}},
+        input_features=[INPUT_FEATURE],
+    )
+    config_path = tmp_path / "task_config.json"
+
+    task_config.save(config_path)
+    loaded = TaskConfig.load(config_path)
+
+    assert loaded.event_filters[0].min_value == -math.inf
+    assert loaded.event_filters[0].max_value == math.inf
+    assert loaded.to_dict() == task_config.to_dict()
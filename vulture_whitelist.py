@@ -32,6 +32,12 @@ from src.hep_foundation.utils.utils import ConfigSerializer
 # We need to simulate accessing the ignore_aliases attribute on the class
 ConfigSerializer.ignore_aliases
 
+# Cache invalidation hook for code that modifies a TaskConfig after construction
+from src.hep_foundation.config.task_config import TaskConfig
+TaskConfig._invalidate
+# Public JSON string API (save() writes to_json_bytes directly)
+TaskConfig.to_json
+
 # Example format:
 # from src.hep_foundation.models.your_model import YourCustomLayer
 # YourCustomLayer.call